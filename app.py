@@ -21,7 +21,7 @@ class CyberGoodNews:
         self._init_collectors()
 
     def _init_collectors(self):
-        rss = RSSCollector()
+        rss = RSSCollector(self.db)
         if rss.is_available():
             self.collectors.append(rss)
 
@@ -31,34 +31,41 @@ class CyberGoodNews:
 
         total_collected = 0
         new_stories = 0
+        # SQLite calls block (writes fsync), so they run in the executor
+        loop = asyncio.get_running_loop()
 
         for collector in self.collectors:
             print(f"\nCollecting from {collector.name}...")
             try:
-                stories = collector.collect()
+                stories = await collector.collect()
                 total_collected += len(stories)
 
+                positive_stories = []
                 if stories:
                     print(f"Scoring {len(stories)} stories for positive impact...")
                     positive_stories = self.processor.process_stories(stories)
 
-                    new_count = self.db.save_stories(positive_stories)
-                    new_stories += new_count
+                # Feed validators are saved with the stories, so feeds are only
+                # skipped as unchanged once their stories are safely stored
+                new_count = await loop.run_in_executor(
+                    None, self.db.save_stories, positive_stories, collector.feed_states
+                )
+                new_stories += new_count
 
-                    if new_count > 0:
-                        print(f"{new_count} new positive stories saved")
+                if new_count > 0:
+                    print(f"{new_count} new positive stories saved")
 
-                        unsent = [s for s in positive_stories
-                                 if not s.is_sent and s.impact_score >= Config.MIN_IMPACT_SCORE]
+                    unsent = [s for s in positive_stories
+                             if not s.is_sent and s.impact_score >= Config.MIN_IMPACT_SCORE]
 
-                        if unsent:
-                            await self.notifier.send_story_batch(unsent, max_alerts=Config.MAX_ALERTS_PER_HOUR)
+                    if unsent:
+                        await self.notifier.send_story_batch(unsent, max_alerts=Config.MAX_ALERTS_PER_HOUR)
 
-                            for story in unsent:
-                                if story.is_sent:
-                                    self.db.mark_as_sent(story.id)
-                    else:
-                        print("No new positive stories (all duplicates)")
+                        for story in unsent:
+                            if story.is_sent:
+                                await loop.run_in_executor(None, self.db.mark_as_sent, story.id)
+                elif stories:
+                    print("No new positive stories (all duplicates)")
 
             except Exception as e:
                 print(f"Error collecting from {collector.name}: {e}")
@@ -68,7 +75,7 @@ class CyberGoodNews:
         print(f"  Total items scanned: {total_collected}")
         print(f"  New positive stories: {new_stories}")
 
-        stats = self.db.get_stats()
+        stats = await loop.run_in_executor(None, self.db.get_stats)
         print(f"\nDatabase Stats:")
         print(f"  Total stories: {stats['total_stories']}")
         print(f"  Sent to Discord: {stats['sent_alerts']}")
@@ -142,7 +149,17 @@ async def main():
         await app.run_continuous()
 
 
+def install_event_loop():
+    """Use uvloop when it is available (it is not on Windows)."""
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+
 if __name__ == '__main__':
+    install_event_loop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
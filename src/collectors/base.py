@@ -10,9 +10,12 @@ class BaseCollector(ABC):
 
     def __init__(self, name: str):
         self.name = name
+        # Feed name -> (etag, last_modified) seen by the last collect() that
+        # changed. The caller stores them with the stories via save_stories.
+        self.feed_states = {}
 
     @abstractmethod
-    def collect(self) -> List[CyberGoodNews]:
+    async def collect(self) -> List[CyberGoodNews]:
         pass
 
     @abstractmethod
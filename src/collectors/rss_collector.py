@@ -1,44 +1,221 @@
 """RSS feed collector for positive cyber news."""
 
+import asyncio
+import aiohttp
 import feedparser
-import hashlib
-from datetime import datetime
-from typing import List
+from datetime import datetime, timezone
+from dateutil import parser as date_parser
+from email.utils import parsedate_to_datetime
+from lxml import etree
+from typing import List, Optional, Tuple
 from .base import BaseCollector
-from ..models import CyberGoodNews
+from ..models import CyberGoodNews, story_id_for
 from ..config import Config
+from ..database import StoryDatabase
 
 
 class RSSCollector(BaseCollector):
     """Collects positive cybersecurity news from RSS feeds."""
 
-    def __init__(self):
+    # Bytes read from the network per parser feed while streaming a feed
+    CHUNK_SIZE = 32 * 1024
+
+    # Namespaces whose elements carry an item's own title/description/date:
+    # plain RSS 2.0, RSS 1.0, Atom 1.0 and Atom 0.3. Extensions such as
+    # media:title or itunes:summary must not override them.
+    CORE_NAMESPACES = (
+        None,
+        'http://purl.org/rss/1.0/',
+        'http://www.w3.org/2005/Atom',
+        'http://purl.org/atom/ns#',
+    )
+    CONTENT_NAMESPACE = 'http://purl.org/rss/1.0/modules/content/'
+
+    def __init__(self, db: Optional[StoryDatabase] = None):
         super().__init__("RSS Feeds")
         self.feeds = Config.RSS_FEEDS
+        # Used to remember ETag / Last-Modified for conditional GETs
+        self.db = db
 
-    def collect(self) -> List[CyberGoodNews]:
-        """Collect from all configured RSS feeds."""
+    async def collect(self) -> List[CyberGoodNews]:
+        """Collect from all configured RSS feeds concurrently."""
         all_stories = []
+        self.feed_states = {}
 
-        for feed_info in self.feeds:
-            try:
-                stories = self._collect_from_feed(feed_info)
-                all_stories.extend(stories)
-                print(f"  Collected {len(stories)} items from {feed_info['name']}")
-            except Exception as e:
-                print(f"  Error collecting from {feed_info['name']}: {str(e)}")
+        # One query per cycle, run in the executor to keep SQLite off the loop
+        states = {}
+        if self.db:
+            loop = asyncio.get_running_loop()
+            states = await loop.run_in_executor(None, self.db.get_feed_states)
+
+        connector = aiohttp.TCPConnector(limit=20)
+        timeout = aiohttp.ClientTimeout(total=30)
+        headers = {'User-Agent': Config.USER_AGENT}
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+            results = await asyncio.gather(
+                *[self._collect_from_feed(session, feed_info, states.get(feed_info['name'], {}))
+                  for feed_info in self.feeds],
+                return_exceptions=True,
+            )
+
+        # gather() keeps feed order, so the log output stays stable
+        for feed_info, result in zip(self.feeds, results):
+            if isinstance(result, Exception):
+                # Timeouts stringify to '', so fall back to the exception type
+                print(f"  Error collecting from {feed_info['name']}: {str(result) or type(result).__name__}")
+                continue
+            all_stories.extend(result)
+            print(f"  Collected {len(result)} items from {feed_info['name']}")
 
         return all_stories
 
-    def _collect_from_feed(self, feed_info: dict) -> List[CyberGoodNews]:
-        """Collect from a single RSS feed."""
-        feed = feedparser.parse(feed_info['url'])
+    async def _fetch_entries(self, session: aiohttp.ClientSession, url: str,
+                             state: dict) -> Tuple[Optional[List[dict]], Tuple[Optional[str], Optional[str]]]:
+        """Download and parse a feed, or return None if it has not changed.
+
+        Also returns the (ETag, Last-Modified) validators for the next poll.
+        """
+        headers = {}
+        if state.get('etag'):
+            headers['If-None-Match'] = state['etag']
+        if state.get('last_modified'):
+            headers['If-Modified-Since'] = state['last_modified']
+
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304:
+                return None, (state.get('etag'), state.get('last_modified'))
+            response.raise_for_status()
+            validators = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+            try:
+                return await self._stream_entries(response), validators
+            except etree.LxmlError:
+                pass
+
+        # Not well-formed XML: download it again for the more forgiving
+        # feedparser, which is CPU-bound and so runs off the event loop.
+        # The validators must describe the body actually parsed.
+        async with session.get(url) as response:
+            response.raise_for_status()
+            validators = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+            body = await response.read()
+        loop = asyncio.get_running_loop()
+        entries = await loop.run_in_executor(None, self._parse_with_feedparser, body)
+        return entries, validators
+
+    async def _collect_from_feed(self, session: aiohttp.ClientSession, feed_info: dict,
+                                 state: dict) -> List[CyberGoodNews]:
+        """Collect from a single RSS feed, given its stored HTTP validators."""
+        entries, validators = await self._fetch_entries(session, feed_info['url'], state)
+        if entries is None:
+            return []
+
         stories = []
 
+        for entry in entries:
+            story = CyberGoodNews(
+                id=story_id_for(entry['link']),
+                title=entry['title'],
+                description=entry['description'],
+                source=feed_info['name'],
+                source_url=entry['link'],
+                published_date=entry['published'] or datetime.now(),
+                collected_date=datetime.now(),
+                category='Uncategorized',
+                impact_score=0.0,
+            )
+
+            stories.append(story)
+
+        # Handed back to the caller, which persists them once the stories
+        # are saved; skipped when nothing changed to avoid a write per feed
+        if validators != (state.get('etag'), state.get('last_modified')):
+            self.feed_states[feed_info['name']] = validators
+
+        return stories
+
+    async def _stream_entries(self, response: aiohttp.ClientResponse) -> List[dict]:
+        """Parse RSS items / Atom entries while the body is still downloading.
+
+        Each chunk is fed to an lxml pull parser as it arrives, so parsing
+        overlaps the download and only one chunk is buffered at a time.
+        """
+        parser = etree.XMLPullParser(
+            events=('end',),
+            tag=('{*}item', '{*}entry'),
+            resolve_entities=False,
+        )
+        entries = []
+
+        async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                entry = self._entry_from_element(elem)
+                if entry:
+                    entries.append(entry)
+
+                # Drop the processed item so memory stays flat on large feeds
+                elem.clear()
+                parent = elem.getparent()
+                if parent is not None:
+                    parent.remove(elem)
+
+                # Feeds list newest first; older items are already stored,
+                # so there is no need to download the rest
+                if self._is_full(entries):
+                    return entries
+
+        parser.close()
+        return entries
+
+    def _entry_from_element(self, elem: etree._Element) -> Optional[dict]:
+        """Map an RSS <item> or Atom <entry> to an entry dict, if it has a link."""
+        link = None
+        permalink = None
+        fields = {}
+        for child in elem:
+            if not isinstance(child.tag, str):
+                continue  # comments and processing instructions
+            qname = etree.QName(child)
+            name, namespace = qname.localname, qname.namespace
+            if name == 'link':
+                href = child.get('href')
+                if href is None:
+                    link = link or (child.text or '').strip()
+                elif child.get('rel', 'alternate') == 'alternate':
+                    link = link or href.strip()
+            elif name == 'guid' and namespace is None:
+                # RSS guids are permalinks unless marked otherwise
+                if child.get('isPermaLink', 'true').strip().lower() != 'false':
+                    permalink = permalink or (child.text or '').strip()
+            elif namespace in self.CORE_NAMESPACES or (
+                    namespace == self.CONTENT_NAMESPACE and name == 'encoded'):
+                fields.setdefault(name, ''.join(child.itertext()).strip())
+
+        # Like feedparser, use a permalink guid when the item has no <link>
+        link = link or permalink
+        if not link:
+            return None
+
+        return {
+            'link': link,
+            'title': fields.get('title', ''),
+            'description': fields.get('description') or fields.get('summary')
+                           or fields.get('encoded') or fields.get('content', ''),
+            'published': self._parse_date(
+                fields.get('pubDate') or fields.get('published') or fields.get('issued')
+            ),
+        }
+
+    def _parse_with_feedparser(self, body: bytes) -> List[dict]:
+        feed = feedparser.parse(body)
+        entries = []
+
         for entry in feed.entries:
-            story_id = hashlib.md5(entry.link.encode()).hexdigest()
+            # Truncated or broken feeds can yield entries without a link
+            if not entry.get('link'):
+                continue
 
-            published_date = datetime.now()
+            published_date = None
             if hasattr(entry, 'published_parsed') and entry.published_parsed:
                 published_date = datetime(*entry.published_parsed[:6])
 
@@ -48,21 +225,38 @@ class RSSCollector(BaseCollector):
             elif hasattr(entry, 'description'):
                 description = entry.description
 
-            story = CyberGoodNews(
-                id=story_id,
-                title=entry.title,
-                description=description,
-                source=feed_info['name'],
-                source_url=entry.link,
-                published_date=published_date,
-                collected_date=datetime.now(),
-                category='Uncategorized',
-                impact_score=0.0,
-            )
+            entries.append({
+                'link': entry.link,
+                'title': entry.get('title', ''),
+                'description': description,
+                'published': published_date,
+            })
 
-            stories.append(story)
+            if self._is_full(entries):
+                break
 
-        return stories
+        return entries
+
+    def _is_full(self, entries: List[dict]) -> bool:
+        """Whether a feed has yielded MAX_ITEMS_PER_FEED entries, the most we keep."""
+        return len(entries) >= Config.MAX_ITEMS_PER_FEED
+
+    def _parse_date(self, value: Optional[str]) -> Optional[datetime]:
+        """Parse an RFC 822 (RSS) or ISO 8601 (Atom) date into naive UTC."""
+        if not value:
+            return None
+
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            try:
+                parsed = date_parser.parse(value)
+            except (ValueError, OverflowError):
+                return None
+
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
 
     def is_available(self) -> bool:
         return True
@@ -12,6 +12,9 @@ class Config:
     # Discord
     DISCORD_WEBHOOK_URL = os.getenv('DISCORD_WEBHOOK_URL')
 
+    # Sent with outgoing HTTP requests
+    USER_AGENT = 'cyber-good-news/1.0'
+
     # News API (optional)
     NEWS_API_KEY = os.getenv('NEWS_API_KEY')
 
@@ -19,6 +22,8 @@ class Config:
     COLLECTION_INTERVAL_MINUTES = int(os.getenv('COLLECTION_INTERVAL_MINUTES', '60'))
     MIN_IMPACT_SCORE = int(os.getenv('MIN_IMPACT_SCORE', '5'))
     MAX_ALERTS_PER_HOUR = int(os.getenv('MAX_ALERTS_PER_HOUR', '5'))
+    # At least 1: a feed is always read up to its newest item
+    MAX_ITEMS_PER_FEED = max(1, int(os.getenv('MAX_ITEMS_PER_FEED', '50')))
 
     # Data storage
     DATABASE_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'stories.db')
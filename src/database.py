@@ -4,7 +4,7 @@ import sqlite3
 import json
 from datetime import datetime
 from typing import List, Optional
-from .models import CyberGoodNews
+from .models import CyberGoodNews, story_id_for
 from .config import Config
 import os
 
@@ -12,13 +12,29 @@ import os
 class StoryDatabase:
     """SQLite database for storing positive cyber news stories."""
 
+    INSERT_STORY_SQL = '''
+        INSERT OR IGNORE INTO stories (
+            id, title, description, source, source_url,
+            published_date, collected_date, category, impact_score,
+            summary, tags, is_processed, is_sent
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path or Config.DATABASE_PATH
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        # Safe with WAL: only the last commits may be lost on power failure
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
     def _init_db(self):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS stories (
                     id TEXT PRIMARY KEY,
@@ -47,63 +63,132 @@ class StoryDatabase:
                 ON stories(collected_date DESC)
             ''')
 
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS feed_state (
+                    feed_name TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT
+                )
+            ''')
+
+            self._migrate_md5_ids(conn)
+
             conn.commit()
 
+            # Known story IDs, so duplicates are skipped without touching SQLite
+            self._seen_ids = {row[0] for row in conn.execute('SELECT id FROM stories')}
+
+    def _migrate_md5_ids(self, conn: sqlite3.Connection):
+        """Rewrite legacy MD5 story IDs (32 hex chars) to the current xxHash IDs.
+
+        Without this, stories already stored under an MD5 ID would be seen as
+        new (and re-alerted) the first time they show up in a feed again.
+        """
+        rows = conn.execute(
+            'SELECT id, source_url, is_sent FROM stories WHERE length(id) = 32'
+        ).fetchall()
+        if not rows:
+            return
+
+        conn.executemany(
+            'UPDATE OR IGNORE stories SET id = ? WHERE id = ?',
+            [(story_id_for(source_url), old_id) for old_id, source_url, _ in rows],
+        )
+
+        # MD5 rows left over already have an xxHash twin (e.g. after a
+        # rollback and redeploy): keep the twin, carrying over is_sent
+        conn.executemany(
+            'UPDATE stories SET is_sent = MAX(is_sent, ?) WHERE id = ?',
+            [(is_sent, story_id_for(source_url)) for _, source_url, is_sent in rows],
+        )
+        conn.execute('DELETE FROM stories WHERE length(id) = 32')
+
     def save_story(self, story: CyberGoodNews) -> bool:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT id FROM stories WHERE id = ?', (story.id,))
-            if cursor.fetchone():
-                return False
-
-            cursor.execute('''
-                INSERT INTO stories (
-                    id, title, description, source, source_url,
-                    published_date, collected_date, category, impact_score,
-                    summary, tags, is_processed, is_sent
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                story.id,
-                story.title,
-                story.description,
-                story.source,
-                story.source_url,
-                story.published_date.isoformat(),
-                story.collected_date.isoformat(),
-                story.category,
-                story.impact_score,
-                story.summary,
-                json.dumps(story.tags) if story.tags else None,
-                1 if story.is_processed else 0,
-                1 if story.is_sent else 0,
-            ))
-            conn.commit()
-            return True
+        if story.id in self._seen_ids:
+            return False
 
-    def save_stories(self, stories: List[CyberGoodNews]) -> int:
-        new_count = 0
+        with self._connect() as conn:
+            cursor = conn.execute(self.INSERT_STORY_SQL, self._story_row(story))
+            conn.commit()
+            self._seen_ids.add(story.id)
+            return cursor.rowcount == 1
+
+    def save_stories(self, stories: List[CyberGoodNews], feed_states: Optional[dict] = None) -> int:
+        """Insert all not-yet-stored stories in a single transaction.
+
+        `feed_states` maps feed names to (etag, last_modified) validators from
+        the fetch that produced these stories. They are committed together
+        with the stories, so a failed save leaves the feeds to be re-fetched.
+        """
+        new_rows = []
+        new_ids = set()
         for story in stories:
-            if self.save_story(story):
-                new_count += 1
-        return new_count
+            if story.id in self._seen_ids or story.id in new_ids:
+                continue
+            new_ids.add(story.id)
+            new_rows.append(self._story_row(story))
+
+        if not new_rows and not feed_states:
+            return 0
+
+        with self._connect() as conn:
+            new_count = 0
+            if new_rows:
+                new_count = conn.executemany(self.INSERT_STORY_SQL, new_rows).rowcount
+            if feed_states:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO feed_state (feed_name, etag, last_modified) VALUES (?, ?, ?)',
+                    [(name, etag, last_modified) for name, (etag, last_modified) in feed_states.items()],
+                )
+            conn.commit()
+            self._seen_ids.update(new_ids)
+            return new_count
+
+    def _story_row(self, story: CyberGoodNews) -> tuple:
+        return (
+            story.id,
+            story.title,
+            story.description,
+            story.source,
+            story.source_url,
+            story.published_date.isoformat(),
+            story.collected_date.isoformat(),
+            story.category,
+            story.impact_score,
+            story.summary,
+            json.dumps(story.tags) if story.tags else None,
+            1 if story.is_processed else 0,
+            1 if story.is_sent else 0,
+        )
 
     def mark_as_sent(self, story_id: str):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute('UPDATE stories SET is_sent = 1 WHERE id = ?', (story_id,))
             conn.commit()
 
-    def get_stats(self) -> dict:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            cursor.execute('SELECT COUNT(*) FROM stories')
-            total = cursor.fetchone()[0]
+    def get_feed_states(self) -> dict:
+        """HTTP validators (ETag / Last-Modified) from the last fetch of each feed."""
+        with self._connect() as conn:
+            rows = conn.execute('SELECT feed_name, etag, last_modified FROM feed_state').fetchall()
 
-            cursor.execute('SELECT COUNT(*) FROM stories WHERE is_sent = 1')
-            sent = cursor.fetchone()[0]
+        return {
+            feed_name: {'etag': etag, 'last_modified': last_modified}
+            for feed_name, etag, last_modified in rows
+        }
 
-            cursor.execute('SELECT AVG(impact_score) FROM stories WHERE impact_score > 0')
-            avg_impact = cursor.fetchone()[0] or 0.0
+    def get_stats(self) -> dict:
+        with self._connect() as conn:
+            # One pass, answered from the covering idx_impact_sent index
+            total, sent, avg_impact = conn.execute('''
+                SELECT
+                    COUNT(*),
+                    SUM(is_sent),
+                    AVG(CASE WHEN impact_score > 0 THEN impact_score END)
+                FROM stories
+            ''').fetchone()
+
+            sent = sent or 0
+            avg_impact = avg_impact or 0.0
 
             return {
                 'total_stories': total,
@@ -1,11 +1,17 @@
 """Data models for positive cyber news stories."""
 
+import xxhash
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List
 
 
-@dataclass
+def story_id_for(url: str) -> str:
+    """Stable story ID derived from the story link (non-cryptographic)."""
+    return xxhash.xxh3_64_hexdigest(url.encode())
+
+
+@dataclass(slots=True)
 class CyberGoodNews:
     """Represents a single positive cybersecurity news story."""
 
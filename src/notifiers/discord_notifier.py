@@ -1,8 +1,10 @@
 """Discord notification handler for positive cyber news via webhooks."""
 
-import requests
+import asyncio
+import aiohttp
+import heapq
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from ..models import CyberGoodNews
 from ..config import Config
 
@@ -10,11 +12,22 @@ from ..config import Config
 class DiscordNotifier:
     """Send positive cybersecurity news to Discord via webhook."""
 
+    # How many times a single alert is retried after a 429 response
+    MAX_RATE_LIMIT_RETRIES = 3
+
     def __init__(self):
         self.webhook_url = Config.DISCORD_WEBHOOK_URL
+        self._session: Optional[aiohttp.ClientSession] = None
+        # time.monotonic() value before which no webhook should be posted
+        self._rate_limited_until = 0.0
 
     async def start(self):
-        pass
+        """Open the HTTP session reused for every webhook POST."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={'User-Agent': Config.USER_AGENT},
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
 
     async def send_story_alert(self, story: CyberGoodNews):
         """Send a single positive news story to Discord."""
@@ -22,35 +35,69 @@ class DiscordNotifier:
         payload = {"embeds": [embed]}
 
         try:
-            response = requests.post(self.webhook_url, json=payload)
-            response.raise_for_status()
-            story.is_sent = True
-            print(f"  Sent: {story.title[:60]}...")
+            await self.start()
+            for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+                await self._wait_for_rate_limit()
+                async with self._session.post(self.webhook_url, json=payload) as response:
+                    self._update_rate_limit(response)
+                    if response.status == 429 and attempt < self.MAX_RATE_LIMIT_RETRIES:
+                        retry_after = await self._retry_after(response)
+                        print(f"  Rate limited by Discord, retrying in {retry_after:.1f}s")
+                        self._rate_limited_until = time.monotonic() + retry_after
+                        continue
+                    response.raise_for_status()
+                story.is_sent = True
+                print(f"  Sent: {story.title[:60]}...")
+                return
         except Exception as e:
             print(f"Error sending to Discord: {e}")
 
+    async def _wait_for_rate_limit(self):
+        """Sleep until the current rate-limit bucket has reset, if exhausted."""
+        delay = self._rate_limited_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _update_rate_limit(self, response: aiohttp.ClientResponse):
+        """Track Discord's X-RateLimit-* headers from a webhook response."""
+        try:
+            remaining = int(response.headers.get('X-RateLimit-Remaining', 1))
+            reset_after = float(response.headers.get('X-RateLimit-Reset-After', 0))
+        except ValueError:
+            return
+
+        if remaining == 0:
+            self._rate_limited_until = time.monotonic() + reset_after
+
+    async def _retry_after(self, response: aiohttp.ClientResponse) -> float:
+        """Seconds to wait before retrying a 429 response."""
+        try:
+            data = await response.json(content_type=None)
+            return float(data['retry_after'])
+        except Exception:
+            return float(response.headers.get('Retry-After', 1))
+
     async def send_story_batch(self, stories: List[CyberGoodNews], max_alerts: int = 5):
         """Send top positive stories with rate limiting."""
-        eligible = [s for s in stories if s.impact_score >= Config.MIN_IMPACT_SCORE]
+        eligible_count = 0
+
+        def eligible():
+            nonlocal eligible_count
+            for s in stories:
+                if s.impact_score >= Config.MIN_IMPACT_SCORE:
+                    eligible_count += 1
+                    yield s
 
-        top_stories = sorted(
-            eligible,
-            key=lambda s: s.impact_score,
-            reverse=True
-        )[:max_alerts]
+        top_stories = heapq.nlargest(max_alerts, eligible(), key=lambda s: s.impact_score)
 
         if not top_stories:
             print("No positive stories to send (none above impact threshold)")
             return
 
-        print(f"Sending top {len(top_stories)} positive stories (out of {len(eligible)} eligible)...")
+        print(f"Sending top {len(top_stories)} positive stories (out of {eligible_count} eligible)...")
 
-        sent_count = 0
         for story in top_stories:
             await self.send_story_alert(story)
-            sent_count += 1
-            if sent_count < len(top_stories):
-                time.sleep(2)
 
     def _create_story_embed(self, story: CyberGoodNews) -> Dict[str, Any]:
         """Create a Discord embed for a positive news story."""
@@ -141,4 +188,6 @@ class DiscordNotifier:
         return icons.get(category, '\U0001f4f0')
 
     async def close(self):
-        pass
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
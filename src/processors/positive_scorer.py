@@ -1,13 +1,32 @@
 """Rule-based processor that scores stories for positive cybersecurity impact."""
 
-import re
+import ahocorasick
+import functools
 import yaml
 import os
-from typing import List, Tuple
+from typing import Dict, List, Set, Tuple
 from ..models import CyberGoodNews
 from ..config import Config
 
 
+def _normalize_keywords(node):
+    """Lowercase every `keywords` list once, so matching never has to."""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == 'keywords' and isinstance(value, list):
+                node[key] = tuple(kw.lower() for kw in value)
+            else:
+                _normalize_keywords(value)
+    return node
+
+
+@functools.lru_cache(maxsize=8)
+def _load_rules(path: str, mtime: float) -> dict:
+    """Parse a scoring file; `mtime` is only part of the cache key so edits reload."""
+    with open(path, 'r') as f:
+        return _normalize_keywords(yaml.safe_load(f))
+
+
 class PositiveScorer:
     """Score and filter news stories for positive cybersecurity impact."""
 
@@ -18,14 +37,56 @@ class PositiveScorer:
             )
         self.scoring_file = scoring_file
         self.rules = self._load_scoring_rules()
+        self._automaton = self._build_automaton()
 
     def _load_scoring_rules(self) -> dict:
         try:
-            with open(self.scoring_file, 'r') as f:
-                return yaml.safe_load(f)
+            path = os.path.abspath(self.scoring_file)
+            return _load_rules(path, os.path.getmtime(path))
         except Exception as e:
             print(f"Warning: Could not load scoring rules: {e}")
-            return self._get_default_rules()
+            return _normalize_keywords(self._get_default_rules())
+
+    def _build_automaton(self) -> ahocorasick.Automaton:
+        """Compile every scoring keyword into one Aho-Corasick automaton.
+
+        Each keyword maps to the list of (kind, name) owners it scores for,
+        so a single scan of the story text yields all per-group counts.
+        """
+        owners: Dict[str, List[Tuple[str, str]]] = {}
+
+        def add(keywords, kind, name=None):
+            for kw in keywords:
+                owners.setdefault(kw, []).append((kind, name))
+
+        add(self.rules.get('positive_signals', {}).get('keywords', []), 'positive')
+        add(self.rules.get('negative_indicators', {}).get('keywords', []), 'negative')
+        for cat_name, cat_data in self.rules.get('positive_categories', {}).items():
+            add(cat_data.get('keywords', []), 'category', cat_name)
+        for mod_name, mod_data in self.rules.get('impact_modifiers', {}).items():
+            add(mod_data.get('keywords', []), 'modifier', mod_name)
+
+        automaton = ahocorasick.Automaton()
+        for kw, kw_owners in owners.items():
+            automaton.add_word(kw, (kw, kw_owners))
+        automaton.make_automaton()
+        return automaton
+
+    def _match_keywords(self, text: str, title_len: int) -> Dict[str, Tuple[list, bool]]:
+        """Map each keyword found in text to (owners, found_in_title).
+
+        The title is the first title_len characters of text; matches come
+        back ordered by end position, so the first hit decides whether the
+        keyword occurs inside the title.
+        """
+        matched = {}
+        if len(self._automaton) == 0:
+            return matched
+
+        for end, (kw, owners) in self._automaton.iter(text):
+            if kw not in matched:
+                matched[kw] = (owners, end < title_len)
+        return matched
 
     def _get_default_rules(self) -> dict:
         return {
@@ -62,19 +123,26 @@ class PositiveScorer:
 
     def _analyze_story(self, story: CyberGoodNews):
         """Analyze a single story for positive impact."""
-        text = f"{story.title} {story.description}".lower()
-
         title_text = story.title.lower()
-
-        # Count positive signals - require at least one in the TITLE
-        positive_signals = self.rules.get('positive_signals', {}).get('keywords', [])
-        title_pos = sum(1 for kw in positive_signals if kw.lower() in title_text)
-        body_pos = sum(1 for kw in positive_signals if kw.lower() in text)
-
-        # Count negative indicators in title
-        negative_keywords = self.rules.get('negative_indicators', {}).get('keywords', [])
-        title_neg = sum(1 for kw in negative_keywords if kw.lower() in title_text)
-        neg_count = sum(1 for kw in negative_keywords if kw.lower() in text)
+        text = f"{title_text} {story.description.lower()}"
+        matched = self._match_keywords(text, len(title_text))
+
+        title_pos = body_pos = 0
+        title_neg = neg_count = 0
+        category_hits: Dict[str, int] = {}
+        modifier_hits: Set[str] = set()
+        for owners, in_title in matched.values():
+            for kind, name in owners:
+                if kind == 'positive':
+                    body_pos += 1
+                    title_pos += in_title
+                elif kind == 'negative':
+                    neg_count += 1
+                    title_neg += in_title
+                elif kind == 'category':
+                    category_hits[name] = category_hits.get(name, 0) + 1
+                else:
+                    modifier_hits.add(name)
 
         # Must have at least 1 positive signal in the title
         if title_pos == 0:
@@ -89,16 +157,16 @@ class PositiveScorer:
             return
 
         # Categorize into positive categories
-        category, base_score = self._categorize(text)
+        category, base_score = self._categorize(category_hits)
         story.category = category
-        story.impact_score = self._calculate_impact(text, base_score)
+        story.impact_score = self._calculate_impact(modifier_hits, base_score)
 
         # Penalize stories that still have negative indicators
         if neg_count > 0:
             story.impact_score -= neg_count * 0.5
 
         story.impact_score = min(10.0, max(0.0, story.impact_score))
-        story.tags = self._extract_tags(text)
+        story.tags = self._extract_tags(matched)
         story.summary = self._generate_summary(story)
 
     def _is_purely_negative(self, text: str) -> bool:
@@ -107,13 +175,13 @@ class PositiveScorer:
         negative_keywords = negative_only.get('keywords', [])
         positive_signals = self.rules.get('positive_signals', {}).get('keywords', [])
 
-        neg_count = sum(1 for kw in negative_keywords if kw.lower() in text)
-        pos_count = sum(1 for kw in positive_signals if kw.lower() in text)
+        neg_count = sum(1 for kw in negative_keywords if kw in text)
+        pos_count = sum(1 for kw in positive_signals if kw in text)
 
         # If heavily negative and no positive signals, it's purely negative
         return neg_count >= 2 and pos_count == 0
 
-    def _categorize(self, text: str) -> Tuple[str, float]:
+    def _categorize(self, category_hits: Dict[str, int]) -> Tuple[str, float]:
         """Categorize story into positive categories."""
         categories = self.rules.get('positive_categories', {})
 
@@ -122,8 +190,7 @@ class PositiveScorer:
         best_base = 3.0
 
         for cat_name, cat_data in categories.items():
-            keywords = cat_data.get('keywords', [])
-            matches = sum(1 for kw in keywords if kw.lower() in text)
+            matches = category_hits.get(cat_name, 0)
             if matches > best_score:
                 best_score = matches
                 best_match = cat_name
@@ -134,28 +201,26 @@ class PositiveScorer:
 
         return best_match, best_base
 
-    def _calculate_impact(self, text: str, base_score: float) -> float:
+    def _calculate_impact(self, modifier_hits: Set[str], base_score: float) -> float:
         """Calculate positive impact score with modifiers."""
         score = base_score
 
         # Apply positive modifiers
         modifiers = self.rules.get('impact_modifiers', {})
         for mod_name, mod_data in modifiers.items():
-            keywords = mod_data.get('keywords', [])
-            modifier = mod_data.get('modifier', 0.0)
-            if any(kw.lower() in text for kw in keywords):
-                score += modifier
+            if mod_name in modifier_hits:
+                score += mod_data.get('modifier', 0.0)
 
         return score
 
-    def _extract_tags(self, text: str) -> List[str]:
-        """Extract relevant tags."""
+    def _extract_tags(self, matched: Dict[str, Tuple[list, bool]]) -> List[str]:
+        """Extract relevant tags from the category keywords found in the story."""
         tags = set(['cyber-good-news', 'security-positive'])
 
         categories = self.rules.get('positive_categories', {})
-        for cat_name, cat_data in categories.items():
-            for kw in cat_data.get('keywords', []):
-                if kw.lower() in text:
+        for cat_data in categories.values():
+            for kw in cat_data.get('keywords', ()):
+                if kw in matched:
                     tags.add(kw)
                     if len(tags) >= 8:
                         return list(tags)[:8]
@@ -189,4 +254,5 @@ class PositiveScorer:
 
     def reload_rules(self):
         self.rules = self._load_scoring_rules()
+        self._automaton = self._build_automaton()
         print("Scoring rules reloaded")
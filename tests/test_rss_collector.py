@@ -0,0 +1,81 @@
+"""Tests for RSS/Atom entry extraction in RSSCollector."""
+
+from lxml import etree
+
+from src.collectors import RSSCollector
+
+
+def _entries(xml: bytes):
+    collector = RSSCollector()
+    root = etree.fromstring(xml)
+    items = root.iter('{*}item', '{*}entry')
+    return [collector._entry_from_element(item) for item in items]
+
+
+def test_extension_elements_do_not_override_core_fields():
+    xml = b'''<?xml version="1.0"?>
+<rss version="2.0"
+     xmlns:media="http://search.yahoo.com/mrss/"
+     xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd"
+     xmlns:dc="http://purl.org/dc/elements/1.1/"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel>
+  <item>
+    <media:title>MEDIA 0</media:title>
+    <itunes:title>ITUNES 0</itunes:title>
+    <dc:title>DC 0</dc:title>
+    <title>Item 0</title>
+    <media:description>media desc</media:description>
+    <itunes:summary>itunes summary</itunes:summary>
+    <description>Item 0 description</description>
+    <link>https://example.com/0</link>
+  </item>
+  <item>
+    <itunes:summary>itunes summary</itunes:summary>
+    <title>Item 1</title>
+    <content:encoded>Full content</content:encoded>
+    <link>https://example.com/1</link>
+  </item>
+</channel>
+</rss>'''
+
+    first, second = _entries(xml)
+
+    assert first['title'] == 'Item 0'
+    assert first['description'] == 'Item 0 description'
+    assert second['title'] == 'Item 1'
+    assert second['description'] == 'Full content'
+
+
+def test_atom_entry_fields():
+    xml = b'''<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:media="http://search.yahoo.com/mrss/">
+  <entry>
+    <media:title>MEDIA</media:title>
+    <title>Court ruling protects privacy</title>
+    <link rel="self" href="https://example.com/self"/>
+    <link rel="alternate" href="https://example.com/c"/>
+    <summary>EFF wins.</summary>
+    <published>2025-06-10T14:00:00+02:00</published>
+  </entry>
+</feed>'''
+
+    (entry,) = _entries(xml)
+
+    assert entry['title'] == 'Court ruling protects privacy'
+    assert entry['link'] == 'https://example.com/c'
+    assert entry['description'] == 'EFF wins.'
+    assert entry['published'].isoformat() == '2025-06-10T12:00:00'
+
+
+def test_permalink_guid_used_when_link_missing():
+    xml = b'''<?xml version="1.0"?>
+<rss version="2.0"><channel>
+  <item><title>A</title><guid>https://example.com/g/1</guid></item>
+  <item><title>B</title><guid isPermaLink="false">tag:example.com,1</guid></item>
+</channel></rss>'''
+
+    first, second = _entries(xml)
+
+    assert first['link'] == 'https://example.com/g/1'
+    assert second is None